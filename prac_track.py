@@ -2,6 +2,8 @@
 import streamlit as st
 import pandas as pd
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime, time
 import io
 import pandas.io.excel
@@ -12,12 +14,57 @@ if 'message' not in st.session_state:
 
 DB_PATH = "practical_hours.db"
 
+# Sites seeded on first run and kept by a system reset
+DEFAULT_SITES = (
+    ("Site A - Hospital A", 120.0),
+    ("Site B - Clinic B", 80.0),
+    ("Site C - Laboratory C", 60.0),
+    ("Site D - Community D", 40.0),
+)
+
+HOURS_LOG_DDL = '''
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        lecturer_name TEXT,
+        student_id TEXT REFERENCES students (student_id) ON DELETE CASCADE,
+        site TEXT,
+        date TEXT,
+        start_time TEXT,
+        end_time TEXT,
+        total_hours REAL,
+        notes TEXT
+    )
+'''
+
+# Serializes all use of the shared connection (Streamlit serves sessions from multiple threads), so no
+# session can read another's uncommitted transaction. Reentrant so a locked section may call a reader.
+_db_lock = threading.RLock()
+
+
+# -------------------------------
+# DB CONNECTION
+# -------------------------------
+@st.cache_resource
+def get_conn():
+    # One long-lived connection per process instead of an open/close on every query
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+    # WAL only lets *other* connections (another app process, a sqlite3 shell) read during a write;
+    # sessions in this process share this connection, so they still take turns on it
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA wal_autocheckpoint=1000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")
+    conn.execute("PRAGMA foreign_keys=ON")
+    return conn
+
 
 # -------------------------------
 # DB INITIALIZATION
 # -------------------------------
 def init_db():
-    with sqlite3.connect(DB_PATH) as conn:
+    conn = get_conn()
+    with _db_lock:
         c = conn.cursor()
 
         # Students table - Includes student_initials for new DBs
@@ -31,27 +78,58 @@ def init_db():
         ''')
 
         # --- DB Migration Check (Ensures schema is correct) ---
-        try:
-            c.execute("SELECT student_initials FROM students LIMIT 1")
-        except sqlite3.OperationalError:
-            c.execute("ALTER TABLE students ADD COLUMN student_initials TEXT")
+        # Tracked with PRAGMA user_version so migrated databases skip the probe
+        if c.execute("PRAGMA user_version").fetchone()[0] < 1:
+            try:
+                c.execute("SELECT student_initials FROM students LIMIT 1")
+            except sqlite3.OperationalError:
+                c.execute("ALTER TABLE students ADD COLUMN student_initials TEXT")
+            c.execute("PRAGMA user_version = 1")
         # --------------------------
 
-        # Practical hours log (No change)
-        c.execute('''
-            CREATE TABLE IF NOT EXISTS hours_log (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                lecturer_name TEXT,
-                student_name TEXT,
-                student_id TEXT,
-                site TEXT,
-                date TEXT,
-                start_time TEXT,
-                end_time TEXT,
-                total_hours REAL,
-                notes TEXT
-            )
-        ''')
+        # Practical hours log - student names are read from students, logs go with their student
+        c.execute(HOURS_LOG_DDL.format(table='hours_log'))
+
+        # --- DB Migration: drop the duplicated hours_log.student_name column ---
+        if c.execute("PRAGMA user_version").fetchone()[0] < 2:
+            if 'student_name' in [row[1] for row in c.execute("PRAGMA table_info(hours_log)")]:
+                # Table rebuild, done with foreign keys off as SQLite's ALTER TABLE docs recommend
+                c.execute("PRAGMA foreign_keys=OFF")
+                try:
+                    c.execute("BEGIN")
+                    # Logs for IDs missing from students would lose their only copy of the name,
+                    # so recreate those students first (most recent logged name wins)
+                    c.execute('''
+                        INSERT OR IGNORE INTO students (student_name, student_id)
+                        SELECT COALESCE(student_name, student_id), student_id FROM hours_log
+                        WHERE student_id IS NOT NULL AND student_id NOT IN (SELECT student_id FROM students)
+                        ORDER BY id DESC
+                    ''')
+                    c.execute("DROP TABLE IF EXISTS hours_log_v2")
+                    c.execute(HOURS_LOG_DDL.format(table='hours_log_v2'))
+                    c.execute('''
+                        INSERT INTO hours_log_v2 (id, lecturer_name, student_id, site, date, start_time, end_time, total_hours, notes)
+                        SELECT id, lecturer_name, student_id, site, date, start_time, end_time, total_hours, notes FROM hours_log
+                    ''')
+                    c.execute("DROP TABLE hours_log")
+                    c.execute("ALTER TABLE hours_log_v2 RENAME TO hours_log")
+                    c.execute("PRAGMA user_version = 2")
+                    c.execute("COMMIT")
+                except Exception:
+                    # Leave the shared connection usable; the next run retries the migration
+                    if conn.in_transaction:
+                        c.execute("ROLLBACK")
+                    raise
+                finally:
+                    c.execute("PRAGMA foreign_keys=ON")
+            else:
+                c.execute("PRAGMA user_version = 2")
+        # --------------------------
+
+        # Indexes for the per-student / per-site lookups. The composite index also covers the
+        # summary's GROUP BY student_id, site and serves plain student_id lookups via its prefix.
+        c.execute("CREATE INDEX IF NOT EXISTS idx_log_student_site ON hours_log (student_id, site, total_hours)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_log_site ON hours_log (site)")
         # Site requirements (No change)
         c.execute('''
             CREATE TABLE IF NOT EXISTS site_requirements (
@@ -60,70 +138,125 @@ def init_db():
             )
         ''')
         # Default sites
-        default_sites = [
-            ("Site A - Hospital A", 120.0),
-            ("Site B - Clinic B", 80.0),
-            ("Site C - Laboratory C", 60.0),
-            ("Site D - Community D", 40.0)
-        ]
-        for site_name, req in default_sites:
+        for site_name, req in DEFAULT_SITES:
             c.execute('INSERT OR IGNORE INTO site_requirements (site_name, required_hours) VALUES (?, ?)',
                       (site_name, req))
-        conn.commit()
 
 
-init_db()
+@st.cache_resource
+def _db_ready():
+    # Schema setup runs once per process rather than on every script rerun
+    init_db()
+    return True
+
+
+_db_ready()
 
 
 # -------------------------------
 # DB HELPER FUNCTIONS
 # -------------------------------
 def run_query(query, params=(), fetch=False):
-    with sqlite3.connect(DB_PATH) as conn:
-        c = conn.cursor()
-        c.execute(query, params)
-        if fetch:
-            return c.fetchall()
-        conn.commit()
+    conn = get_conn()
+    if fetch:
+        with _db_lock:
+            return conn.execute(query, params).fetchall()
+    # Connection is in autocommit mode, so each write is committed as it executes
+    with _db_lock:
+        conn.execute(query, params)
+    clear_data_cache()
+
 
+def clear_data_cache():
+    # Called after every write so cached DataFrames never outlive the data they were built from
+    get_students_df.clear()
+    get_student_lookup.clear()
+    get_sites_df.clear()
+    get_records_df.clear()
 
+
+@st.cache_data(ttl=300)
 def get_students_df():
-    df = pd.DataFrame(run_query("SELECT * FROM students ORDER BY student_name", fetch=True),
-                      columns=['id', 'student_name', 'student_initials', 'student_id'])
+    with _db_lock:
+        df = pd.read_sql_query("SELECT * FROM students ORDER BY student_name", get_conn())
     if not df.empty:
         df['student_id'] = df['student_id'].astype(str)
     return df
 
 
+@st.cache_data(ttl=300)
+def get_student_lookup():
+    # student_name -> student_id; the first match wins for duplicate names, as with the old .iloc[0] lookup
+    students = get_students_df().drop_duplicates('student_name')
+    return dict(zip(students['student_name'], students['student_id']))
+
+
+@st.cache_data(ttl=300)
 def get_sites_df():
-    return pd.DataFrame(run_query("SELECT * FROM site_requirements", fetch=True),
-                        columns=['site_name', 'required_hours'])
+    with _db_lock:
+        return pd.read_sql_query("SELECT * FROM site_requirements", get_conn())
 
 
+@st.cache_data(ttl=300)
 def get_records_df():
-    return pd.DataFrame(run_query("SELECT * FROM hours_log ORDER BY date DESC, student_name", fetch=True),
-                        columns=['id', 'lecturer_name', 'student_name', 'student_id', 'site', 'date', 'start_time',
-                                 'end_time', 'total_hours', 'notes'])
+    with _db_lock:
+        df = pd.read_sql_query('''
+            SELECT h.id, h.lecturer_name, s.student_name, h.student_id, h.site, h.date, h.start_time, h.end_time,
+                   h.total_hours, h.notes
+            FROM hours_log h
+            LEFT JOIN students s ON s.student_id = h.student_id
+            ORDER BY h.date DESC, s.student_name
+        ''', get_conn())
+    # Few distinct values repeated across many rows, so store them as category codes
+    df['site'] = df['site'].astype('category')
+    df['student_id'] = df['student_id'].astype('category')
+    return df
 
 
-def add_student(student_name, student_initials, student_id):
+@contextmanager
+def write_transaction():
+    # Groups several writes into one BEGIN/COMMIT on the shared autocommit connection
+    conn = get_conn()
     try:
-        student_id = str(student_id).strip()
-        run_query("INSERT INTO students (student_name, student_initials, student_id) VALUES (?, ?, ?)",
-                  (student_name, student_initials, student_id))
-        return True, "Student added"
-    except sqlite3.IntegrityError:
-        return False, f"Student ID {student_id} already exists"
+        with _db_lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+    finally:
+        # Cleared on rollback too, so nothing cached during the transaction outlives it
+        clear_data_cache()
+
+
+def add_students_bulk(rows):
+    """Insert (student_name, student_initials, student_id) rows in one transaction; returns the number added."""
+    with write_transaction() as conn:
+        before = conn.total_changes
+        conn.executemany("INSERT OR IGNORE INTO students (student_name, student_initials, student_id) VALUES (?, ?, ?)",
+                         rows)
+        return conn.total_changes - before
+
+
+def reset_data():
+    # Clear students and logs, and every site except the defaults, in a single transaction
+    default_names = tuple(site_name for site_name, _ in DEFAULT_SITES)
+    with write_transaction() as conn:
+        conn.execute("DELETE FROM hours_log")
+        conn.execute("DELETE FROM students")
+        conn.execute(f"DELETE FROM site_requirements WHERE site_name NOT IN ({','.join('?' * len(default_names))})",
+                     default_names)
 
 
 def update_student(student_id, new_name):
     run_query("UPDATE students SET student_name=? WHERE student_id=?", (new_name, student_id))
-    run_query("UPDATE hours_log SET student_name=? WHERE student_id=?", (new_name, student_id))
 
 
 def delete_student(student_id):
+    # The student's hours_log rows are removed by ON DELETE CASCADE
     run_query("DELETE FROM students WHERE student_id=?", (student_id,))
-    run_query("DELETE FROM hours_log WHERE student_id=?", (student_id,))
 
 
 def set_site_requirement(site_name, required_hours):
@@ -131,35 +264,64 @@ def set_site_requirement(site_name, required_hours):
               (site_name, required_hours))
 
 
-def add_hours_log(lecturer, student_name, student_id, site, date, start_time, end_time, total_hours, notes):
+def add_hours_log(lecturer, student_id, site, date, start_time, end_time, total_hours, notes):
     run_query('''
-        INSERT INTO hours_log (lecturer_name, student_name, student_id, site, date, start_time, end_time, total_hours, notes)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (lecturer, student_name, student_id, site, date, start_time, end_time, total_hours, notes))
+        INSERT INTO hours_log (lecturer_name, student_id, site, date, start_time, end_time, total_hours, notes)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ''', (lecturer, student_id, site, date, start_time, end_time, total_hours, notes))
 
 
 def calculate_summary():
     students = get_students_df()
     sites = get_sites_df()
-    records = get_records_df()
     if students.empty:
         return pd.DataFrame()
-    rows = []
-    for _, s in students.iterrows():
-        row = {"Student Name": s['student_name'], "Student ID": s['student_id']}
-        for _, site in sites.iterrows():
-            completed = records[(records['student_id'] == s['student_id']) & (records['site'] == site['site_name'])]
-            total_completed = completed['total_hours'].sum() if not completed.empty else 0
-            row[f"{site['site_name']} - Completed"] = round(total_completed, 2)
-            row[f"{site['site_name']} - Required"] = site['required_hours']
-            row[f"{site['site_name']} - Owed"] = round(site['required_hours'] - total_completed, 2)
-        rows.append(row)
-    return pd.DataFrame(rows)
+    # Aggregate once in SQLite, then pivot to one row per student and one column per site
+    with _db_lock:
+        agg = pd.read_sql("SELECT student_id, site, SUM(total_hours) AS completed FROM hours_log GROUP BY student_id, site",
+                          get_conn())
+    completed = (agg.pivot(index='student_id', columns='site', values='completed')
+                 .reindex(index=students['student_id'], columns=sites['site_name'])
+                 .fillna(0))
+    required = sites.set_index('site_name')['required_hours']
+    owed = completed.rsub(required, axis=1)
+
+    summary = pd.DataFrame({"Student Name": students['student_name'].to_numpy(),
+                            "Student ID": students['student_id'].to_numpy()})
+    for site_name in sites['site_name']:
+        summary[f"{site_name} - Completed"] = completed[site_name].round(2).to_numpy()
+        summary[f"{site_name} - Required"] = required[site_name]
+        summary[f"{site_name} - Owed"] = owed[site_name].round(2).to_numpy()
+    return summary
+
+
+# Exports with more rows than this stream through openpyxl's write-only mode
+LARGE_EXPORT_ROWS = 50_000
+
+
+def _write_excel_write_only(output, dfs_dict):
+    # Rows are flushed as they are appended, so memory stays flat regardless of sheet size
+    from openpyxl import Workbook
+    wb = Workbook(write_only=True)
+    for sheet_name, df in dfs_dict.items():
+        ws = wb.create_sheet(sheet_name)
+        ws.append([str(c) for c in df.columns])
+        for row in df.itertuples(index=False, name=None):
+            ws.append([None if pd.isna(v) else v for v in row])
+    wb.save(output)
 
 
 # Handles the Excel export engine fallbacks
 def to_excel_bytes(dfs_dict):
     output = io.BytesIO()
+    if max(len(df) for df in dfs_dict.values()) > LARGE_EXPORT_ROWS:
+        try:
+            _write_excel_write_only(output, dfs_dict)
+        except Exception as e:
+            st.error(f"Error exporting Excel. Ensure dependencies are installed: `pip install openpyxl`. Error: {e}")
+            return None
+        return output.getvalue()
+
     try:
         engine = 'xlsxwriter'
         with pd.ExcelWriter(output, engine=engine) as writer:
@@ -221,9 +383,10 @@ if menu == "🏠 Home":
     total_hours = records_df['total_hours'].sum() if not records_df.empty else 0
     col3.metric("Total Hours Logged", f"{total_hours:.1f}")
 
-    styled_sites_df = sites_df.copy()
-    styled_sites_df['required_hours'] = styled_sites_df['required_hours'].apply(lambda x: f"{x:.1f}")
-    st.table(styled_sites_df)
+    # Formatting is applied client-side instead of converting the column to strings
+    st.dataframe(sites_df, column_config={
+        'required_hours': st.column_config.NumberColumn(format="%.1f")
+    })
 
 # -------------------------------
 # UPLOAD CLASS LIST
@@ -234,18 +397,20 @@ elif menu == "📤 Upload Class List":
 
     if uploaded_file:
         try:
+            # Read the known columns as str so IDs keep leading zeros and skip type inference
+            # (the pyarrow CSV engine infers first and would turn '0012' into '12')
+            upload_dtypes = {'student_name': str, 'student_initials': str, 'student_id': str}
             if uploaded_file.name.endswith(".csv"):
-                # Use str dtype for 'student_id' column to prevent reading it as a mix of int/str
-                df_upload = pd.read_csv(uploaded_file, dtype={'student_id': str})
+                df_upload = pd.read_csv(uploaded_file, dtype=upload_dtypes)
             else:
-                df_upload = pd.read_excel(uploaded_file, dtype={'student_id': str})
+                df_upload = pd.read_excel(uploaded_file, dtype=upload_dtypes)
         except Exception as e:
             st.error(f"Could not read file: {e}")
             df_upload = None
 
         if df_upload is not None:
             # Clean up column headers before display/mapping
-            df_upload.columns = [str(c).strip().lower() for c in df_upload.columns]
+            df_upload.columns = df_upload.columns.astype(str).str.strip().str.lower()
 
             standard_cols = ['student_name', 'student_initials', 'student_id']
             found_cols = [c for c in df_upload.columns if c in standard_cols]
@@ -256,20 +421,16 @@ elif menu == "📤 Upload Class List":
                 st.dataframe(df_upload.head(50))
 
             elif st.button("Import Students"):
-                added = 0
-                skipped = 0
-                for _, row in df_upload.iterrows():
-                    name = str(row.get('student_name', '')).strip()
-                    student_id = str(row.get('student_id', '')).strip()
-                    initials = str(row.get('student_initials', '')).strip() if 'student_initials' in row else ''
-                    if initials == 'nan': initials = ''
-
-                    if name and student_id:
-                        success, msg = add_student(name, initials, student_id)
-                        if success:
-                            added += 1
-                        else:
-                            skipped += 1
+                # Clean whole columns at once; student_initials is optional and defaults to ''
+                cleaned = df_upload.reindex(columns=standard_cols).fillna('').astype(str)
+                for col in cleaned:
+                    cleaned[col] = cleaned[col].str.strip()
+                cleaned = cleaned[(cleaned['student_name'] != '') & (cleaned['student_id'] != '')]
+                rows = list(cleaned.itertuples(index=False, name=None))
+
+                # Single transaction for the whole file; duplicates are ignored by the UNIQUE student_id
+                added = add_students_bulk(rows)
+                skipped = len(rows) - added
 
                 st.session_state.message = (
                 'success', f"Added {added} students, skipped {skipped} (duplicates or empty data).")
@@ -299,11 +460,9 @@ elif menu == "👩‍🎓 Manage Students":
         initial_name = ''
 
         if selected_name:
-            try:
-                selected_id = df[df['student_name'] == selected_name]['student_id'].iloc[0]
+            selected_id = get_student_lookup().get(selected_name, '')
+            if selected_id:
                 initial_name = selected_name
-            except IndexError:
-                pass
 
         new_name = st.text_input("Edit Name (will be used to update the student's name)", value=initial_name,
                                  key='manage_student_name_input')
@@ -330,12 +489,7 @@ elif menu == "👩‍🎓 Manage Students":
             st.warning("This action will permanently delete ALL student records and ALL hour logs from the database.")
 
             if st.button("Confirm and Reset System Data", key='reset_data_final'):
-                run_query("DELETE FROM students")
-                run_query("DELETE FROM hours_log")
-                # Clear site requirements too for a full reset
-                # Only clear default entries to avoid deleting necessary ones later
-                run_query(
-                    "DELETE FROM site_requirements WHERE site_name NOT IN ('Site A - Hospital A', 'Site B - Clinic B', 'Site C - Laboratory C', 'Site D - Community D')")
+                reset_data()
 
                 st.session_state.message = ('error', "SYSTEM DATA RESET COMPLETE. Please re-upload your class list.")
                 st.rerun()
@@ -415,9 +569,7 @@ elif menu == "🕒 Log Practical Hours":
             student_name_list = students['student_name'].tolist()
             student_name = st.selectbox("Select Student", student_name_list)
 
-            student_id = ''
-            if student_name and not students[students['student_name'] == student_name]['student_id'].empty:
-                student_id = students[students['student_name'] == student_name]['student_id'].iloc[0]
+            student_id = get_student_lookup().get(student_name, '')
 
             site_list = sites['site_name'].tolist()
             site = st.selectbox("Select Site", site_list)
@@ -429,23 +581,24 @@ elif menu == "🕒 Log Practical Hours":
             with col2:
                 end_time_in = st.time_input("End", value=time(17, 0))
 
-            total_hours = 0
-            try:
-                start_dt = datetime.combine(date, start_time_in)
-                end_dt = datetime.combine(date, end_time_in)
+            notes = st.text_area("Notes")
 
-                if end_dt < start_dt:
-                    end_dt = end_dt + pd.Timedelta(days=1)
+            if st.form_submit_button("Log Hours"):
+                # Duration is only needed on submit, so other reruns skip the datetime work
+                total_hours = 0
+                try:
+                    start_dt = datetime.combine(date, start_time_in)
+                    end_dt = datetime.combine(date, end_time_in)
 
-                duration = end_dt - start_dt
-                total_hours = round(duration.total_seconds() / 3600, 2)
-                st.info(f"Calculated Duration: {total_hours} hours")
-            except Exception:
-                st.error("Error calculating hours. Check date/time inputs.")
+                    if end_dt < start_dt:
+                        end_dt = end_dt + pd.Timedelta(days=1)
 
-            notes = st.text_area("Notes")
+                    duration = end_dt - start_dt
+                    total_hours = round(duration.total_seconds() / 3600, 2)
+                    st.info(f"Calculated Duration: {total_hours} hours")
+                except Exception:
+                    st.error("Error calculating hours. Check date/time inputs.")
 
-            if st.form_submit_button("Log Hours"):
                 required_fields_ok = all([
                     total_hours > 0,
                     lecturer.strip(),
@@ -454,7 +607,7 @@ elif menu == "🕒 Log Practical Hours":
                 ])
 
                 if required_fields_ok:
-                    add_hours_log(lecturer.strip(), student_name, student_id.strip(), site.strip(), str(date),
+                    add_hours_log(lecturer.strip(), student_id.strip(), site.strip(), str(date),
                                   str(start_time_in), str(end_time_in), total_hours, notes)
                     st.session_state.message = ('success', f"Logged {total_hours} hours for {student_name} at {site}.")
                     st.rerun()
@@ -472,10 +625,14 @@ elif menu == "📋 View Records":
         st.info("No records yet")
     else:
         st.dataframe(df)
-        excel_bytes = to_excel_bytes({"Records": df})
-        if excel_bytes:
-            st.download_button("Export Excel", data=excel_bytes, file_name="records.xlsx",
-                               mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+        st.download_button("Export CSV", data=df.to_csv(index=False, chunksize=50_000).encode(),
+                           file_name="records.csv", mime="text/csv")
+        # Excel generation is much slower than CSV, so only build it on request
+        if st.checkbox("Generate Excel (slower)", key='records_excel'):
+            excel_bytes = to_excel_bytes({"Records": df})
+            if excel_bytes:
+                st.download_button("Export Excel", data=excel_bytes, file_name="records.xlsx",
+                                   mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
 
 # -------------------------------
 # COMPLETION SUMMARY
@@ -487,7 +644,11 @@ elif menu == "📈 Completion Summary":
         st.info("No data. Add students and log hours.")
     else:
         st.dataframe(summary)
-        excel_bytes = to_excel_bytes({"Summary": summary})
-        if excel_bytes:
-            st.download_button("Export Summary", data=excel_bytes, file_name="summary.xlsx",
-                               mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
\ No newline at end of file
+        st.download_button("Export Summary CSV", data=summary.to_csv(index=False, chunksize=50_000).encode(),
+                           file_name="summary.csv", mime="text/csv")
+        # Excel generation is much slower than CSV, so only build it on request
+        if st.checkbox("Generate Excel (slower)", key='summary_excel'):
+            excel_bytes = to_excel_bytes({"Summary": summary})
+            if excel_bytes:
+                st.download_button("Export Summary", data=excel_bytes, file_name="summary.xlsx",
+                                   mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
\ No newline at end of file